@@ -5,9 +5,10 @@ Quick demonstration of the sf_restcalls library.
 This script shows how to use the library both programmatically and via CLI.
 """
 
+import contextlib
+import io
 import os
 import sys
-import subprocess
 
 def check_installation():
     """Check if the library can be imported."""
@@ -109,11 +110,18 @@ def test_cli_help():
     print("="*60)
     
     try:
-        result = subprocess.run([sys.executable, "-m", "sf_restcalls", "--help"], 
-                               capture_output=True, text=True, timeout=10)
-        print(result.stdout)
-    except subprocess.TimeoutExpired:
-        print("Help command timed out")
+        # Call the CLI in-process instead of spawning a fresh interpreter;
+        # argparse exits via SystemExit after printing help
+        from sf_restcalls.cli import main as cli_main
+        buf = io.StringIO()
+        saved_argv = sys.argv
+        sys.argv = ['sf-restcalls', '--help']
+        try:
+            with contextlib.redirect_stdout(buf), contextlib.suppress(SystemExit):
+                cli_main()
+        finally:
+            sys.argv = saved_argv
+        print(buf.getvalue())
     except Exception as e:
         print(f"Error running help command: {e}")
 
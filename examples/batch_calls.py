@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Example showing how to batch several stored procedure calls.
+
+This example demonstrates:
+1. Submitting multiple procedure calls as one multi-statement request
+2. Running independent calls concurrently with gather_procedures
+"""
+
+import asyncio
+import os
+from sf_restcalls import AsyncSnowflakeClient
+
+async def main():
+    # Configuration
+    config = {
+        'account': os.getenv('SNOWFLAKE_ACCOUNT', 'your-account.snowflakecomputing.com'),
+        'username': os.getenv('SNOWFLAKE_USERNAME', 'your-username'),
+        'token': os.getenv('SNOWFLAKE_TOKEN', 'your-pat-token'),
+        'warehouse': os.getenv('SNOWFLAKE_WAREHOUSE', 'your-warehouse'),
+        'database': os.getenv('SNOWFLAKE_DATABASE', 'your-database'),
+        'schema': os.getenv('SNOWFLAKE_SCHEMA', 'your-schema'),
+    }
+
+    calls = [
+        ("my_string_proc", ["hello world"]),
+        ("my_math_proc", [42, 3.14159]),
+        ("my_report_proc", ["report_name", 100, True]),
+        ("sp_example", None),
+    ]
+
+    try:
+        async with AsyncSnowflakeClient(**config) as client:
+            # Option 1: one multi-statement request (1 round-trip for N calls)
+            print("=== Batched multi-statement request ===")
+            results = await client.call_batch(calls)
+            for (name, params), result in zip(calls, results):
+                print(f"{name}{params or '()'}: {result}")
+
+            # Option 2: concurrent independent requests over one session
+            print("\n=== Concurrent calls with gather_procedures ===")
+            results = await client.gather_procedures(calls)
+            for (name, params), result in zip(calls, results):
+                print(f"{name}{params or '()'}: {result}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+if __name__ == '__main__':
+    print("Snowflake REST Calls - Batch Calls Example")
+    print("==========================================")
+    print()
+    asyncio.run(main())
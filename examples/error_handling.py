@@ -104,22 +104,46 @@ def demonstrate_recovery_strategies():
     """Demonstrate error recovery strategies."""
     print("\n=== Recovery Strategies ===")
     
-    # Strategy 1: Retry with exponential backoff
+    # Strategy 1: Retry with exponential backoff and jitter
     def retry_with_backoff(func, max_retries=3, base_delay=1):
-        """Retry function with exponential backoff."""
+        """Retry function with exponential backoff and random jitter."""
         import time
-        
+        import random
+
         for attempt in range(max_retries):
             try:
                 return func()
             except Exception as e:
                 if attempt == max_retries - 1:
                     raise e
-                
+
+                # Jitter spreads retries out so many clients failing at once
+                # don't all hammer Snowflake again at the same instant
                 delay = base_delay * (2 ** attempt)
+                delay += random.uniform(0, delay / 2)
                 print(f"Attempt {attempt + 1} failed: {e}")
-                print(f"Retrying in {delay} seconds...")
+                print(f"Retrying in {delay:.2f} seconds...")
                 time.sleep(delay)
+
+    # Strategy 1b: Async retry — the sleep yields the event loop so other
+    # in-flight queries keep running while this one backs off
+    async def retry_with_backoff_async(afunc, max_retries=3, base_delay=1):
+        """Retry an awaitable with exponential backoff and full jitter."""
+        import asyncio
+        import random
+
+        for attempt in range(max_retries):
+            try:
+                return await afunc()
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    raise e
+
+                delay = base_delay * (2 ** attempt)
+                delay += random.uniform(0, delay / 2)
+                print(f"Attempt {attempt + 1} failed: {e}")
+                print(f"Retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
     
     # Strategy 2: Graceful degradation
     def call_procedure_with_fallback(client, primary_proc, fallback_proc, params=None):
@@ -139,14 +163,17 @@ def demonstrate_recovery_strategies():
             self.failure_count = 0
             self.last_failure_time = None
             self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
-        
+
         def call(self, func, *args, **kwargs):
+            import time
+
+            # monotonic() is immune to system clock adjustments
             if self.state == "OPEN":
-                if time.time() - self.last_failure_time < self.recovery_timeout:
+                if time.monotonic() - self.last_failure_time < self.recovery_timeout:
                     raise Exception("Circuit breaker is OPEN")
                 else:
                     self.state = "HALF_OPEN"
-            
+
             try:
                 result = func(*args, **kwargs)
                 self.failure_count = 0
@@ -154,11 +181,11 @@ def demonstrate_recovery_strategies():
                 return result
             except Exception as e:
                 self.failure_count += 1
-                self.last_failure_time = time.time()
-                
+                self.last_failure_time = time.monotonic()
+
                 if self.failure_count >= self.failure_threshold:
                     self.state = "OPEN"
-                
+
                 raise e
     
     print("✓ Recovery strategies implemented (retry, fallback, circuit breaker)")
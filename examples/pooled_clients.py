@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Example showing how to share pooled clients across worker threads.
+
+This example demonstrates:
+1. Creating a process-wide SnowflakeClientPool
+2. Checking clients out with pool.acquire() from multiple threads
+3. Amortizing the PAT authentication round-trip across many calls
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from sf_restcalls.pool import SnowflakeClientPool
+
+def main():
+    # Configuration
+    config = {
+        'account': os.getenv('SNOWFLAKE_ACCOUNT', 'your-account.snowflakecomputing.com'),
+        'username': os.getenv('SNOWFLAKE_USERNAME', 'your-username'),
+        'token': os.getenv('SNOWFLAKE_TOKEN', 'your-pat-token'),
+        'warehouse': os.getenv('SNOWFLAKE_WAREHOUSE', 'your-warehouse'),
+        'database': os.getenv('SNOWFLAKE_DATABASE', 'your-database'),
+        'schema': os.getenv('SNOWFLAKE_SCHEMA', 'your-schema'),
+    }
+
+    pool = SnowflakeClientPool(size=4, **config)
+
+    def run_procedure(i):
+        # Each worker borrows an already-authenticated client
+        with pool.acquire() as client:
+            return client.call_stored_procedure("sp_example")
+
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for i, results in enumerate(executor.map(run_procedure, range(8))):
+                print(f"Call {i + 1}: {results}")
+    except Exception as e:
+        print(f"Error: {e}")
+    finally:
+        pool.close_all()
+
+if __name__ == '__main__':
+    print("Snowflake REST Calls - Client Pool Example")
+    print("==========================================")
+    print()
+    main()
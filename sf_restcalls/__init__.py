@@ -3,8 +3,26 @@ Snowflake REST Calls Library
 A Python library for connecting to Snowflake using PAT tokens and executing stored procedures.
 """
 
-from .snowflake_client import SnowflakeClient
-from .exceptions import SnowflakeConnectionError, StoredProcedureError
-
 __version__ = "1.0.0"
-__all__ = ["SnowflakeClient", "SnowflakeConnectionError", "StoredProcedureError"]
+__all__ = ["SnowflakeClient", "AsyncSnowflakeClient", "SnowflakeConnectionError", "StoredProcedureError"]
+
+# Submodule that provides each public name; imports are deferred (PEP 562)
+# so `sf-restcalls --help` doesn't pay for the connector/aiohttp stack
+_LAZY_IMPORTS = {
+    "SnowflakeClient": "snowflake_client",
+    "AsyncSnowflakeClient": "async_client",
+    "SnowflakeConnectionError": "exceptions",
+    "StoredProcedureError": "exceptions",
+}
+
+
+def __getattr__(name):
+    submodule = _LAZY_IMPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(f".{submodule}", __name__), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,82 @@
+"""
+Process-wide pool of live Snowflake connections, shared across clients.
+
+Connections are pooled per connection key (account, user, context), so a
+client whose parameters match an idle pooled connection reuses it instead of
+paying the OAuth exchange + TLS + session setup again.
+"""
+
+import queue
+import threading
+from typing import Optional, Tuple
+
+# Idle connections kept per distinct connection key; overflow is closed
+MAX_IDLE_PER_KEY = 4
+
+_POOLS: dict = {}
+_LOCK = threading.Lock()
+
+
+def _queue_for(key: Tuple) -> "queue.Queue":
+    """Return (creating if needed) the idle-connection queue for `key`."""
+    with _LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = queue.Queue(maxsize=MAX_IDLE_PER_KEY)
+        return pool
+
+
+def acquire(key: Tuple):
+    """
+    Pop a live pooled connection for `key`, or return None.
+
+    Dead connections found in the pool are discarded.
+    """
+    pool = _queue_for(key)
+    while True:
+        try:
+            connection = pool.get_nowait()
+        except queue.Empty:
+            return None
+        try:
+            if not connection.is_closed():
+                return connection
+        except Exception:
+            pass  # treat as dead and keep looking
+
+
+def release(key: Tuple, connection) -> bool:
+    """
+    Return a connection to the pool for `key`.
+
+    Returns True if the connection was pooled; False if it was dead or the
+    pool is full, in which case the caller should close it.
+    """
+    try:
+        if connection.is_closed():
+            return False
+    except Exception:
+        return False
+    pool = _queue_for(key)
+    try:
+        pool.put_nowait(connection)
+        return True
+    except queue.Full:
+        return False
+
+
+def close_all() -> None:
+    """Close every pooled connection. Call on graceful shutdown."""
+    with _LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        while True:
+            try:
+                connection = pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                connection.close()
+            except Exception:
+                pass
@@ -0,0 +1,591 @@
+"""
+Async Snowflake client using the SQL REST API (/api/v2/statements) over aiohttp.
+"""
+
+import asyncio
+import gzip
+import json
+import uuid
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+import aiohttp
+from .exceptions import (
+    SnowflakeConnectionError,
+    StoredProcedureError,
+    AuthenticationError
+)
+
+# SQL API response codes that mean "statement is still running"
+_RUNNING_CODES = {'333333', '333334'}
+
+# Request bodies larger than this are gzip-compressed before upload
+_GZIP_THRESHOLD = 1024
+
+
+class QueryHandle:
+    """
+    Handle for a statement submitted with asyncExec=true.
+
+    Attributes:
+        statement_handle: Snowflake statement handle returned by the SQL API
+        request_id: Client-generated request ID used for the submission
+    """
+
+    def __init__(self, statement_handle: str, request_id: str):
+        self.statement_handle = statement_handle
+        self.request_id = request_id
+
+    def __repr__(self):
+        return f"QueryHandle(statement_handle={self.statement_handle!r}, request_id={self.request_id!r})"
+
+
+class AsyncSnowflakeClient:
+    """
+    An asynchronous client for calling Snowflake stored procedures over the
+    SQL REST API using a PAT token.
+
+    Unlike SnowflakeClient (which uses the Snowflake connector), this client
+    talks directly to the /api/v2/statements endpoint, so independent calls
+    can be overlapped with asyncio.gather instead of paying one full
+    round-trip per call.
+    """
+
+    def __init__(self,
+                 account: str,
+                 username: str,
+                 token: str,
+                 warehouse: Optional[str] = None,
+                 database: Optional[str] = None,
+                 schema: Optional[str] = None,
+                 role: Optional[str] = None,
+                 timeout: float = 60.0,
+                 max_parallel_chunks: int = 8):
+        """
+        Initialize the async Snowflake client.
+
+        Args:
+            account: Snowflake account identifier (e.g. myaccount.snowflakecomputing.com)
+            username: Snowflake username
+            token: Personal Access Token (PAT)
+            warehouse: Snowflake warehouse (optional)
+            database: Snowflake database (optional)
+            schema: Snowflake schema (optional)
+            role: Snowflake role (optional)
+            timeout: Total timeout in seconds for each HTTP request
+            max_parallel_chunks: Maximum number of result chunks downloaded concurrently
+        """
+        self.account = account
+        self.username = username
+        self.token = token
+        self.warehouse = warehouse
+        self.database = database
+        self.schema = schema
+        self.role = role
+        self.timeout = timeout
+        self.max_parallel_chunks = max_parallel_chunks
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Pre-encoded request body for the no-argument sp_example call,
+        # built lazily once per client (the session context is fixed here)
+        self._sp_example_body: Optional[bytes] = None
+
+        # Set up logging
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def base_url(self) -> str:
+        """Base URL for the Snowflake SQL API."""
+        account = self.account
+        if '.' not in account:
+            account = f"{account}.snowflakecomputing.com"
+        return f"https://{account}/api/v2"
+
+    async def connect(self) -> None:
+        """
+        Create the shared HTTP session used for all API calls.
+
+        The session holds a keep-alive connection pool, so the TCP + TLS
+        handshake is paid once per client rather than once per call.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=32,
+                keepalive_timeout=60
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    'Authorization': f'Bearer {self.token}',
+                    'Content-Type': 'application/json',
+                    'Accept': 'application/json',
+                    'Accept-Encoding': 'gzip',
+                    'Connection': 'keep-alive',
+                    'User-Agent': 'sf-restcalls/1.0',
+                },
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self.logger.info(f"Opened HTTP session for Snowflake account: {self.account}")
+
+    async def disconnect(self) -> None:
+        """Close the shared HTTP session."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+            self.logger.info("Closed HTTP session")
+        self.session = None
+
+    def _build_statement_body(self, statement: str) -> Dict[str, Any]:
+        """Build the JSON body for a /statements request."""
+        body = {
+            'statement': statement,
+            'timeout': int(self.timeout),
+            'resultSetMetaData': {'format': 'json'},
+        }
+        if self.warehouse:
+            body['warehouse'] = self.warehouse
+        if self.database:
+            body['database'] = self.database
+        if self.schema:
+            body['schema'] = self.schema
+        if self.role:
+            body['role'] = self.role
+        return body
+
+    @staticmethod
+    def _parse_results(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Convert one SQL API response partition into a list of row dicts."""
+        metadata = payload.get('resultSetMetaData') or {}
+        columns = [col['name'] for col in metadata.get('rowType', [])]
+        rows = payload.get('data') or []
+        return [dict(zip(columns, row)) for row in rows]
+
+    async def _get_partition(self,
+                             statement_handle: str,
+                             partition: int) -> Dict[str, Any]:
+        """GET one result partition of a completed statement."""
+        try:
+            async with self.session.get(
+                f"{self.base_url}/statements/{statement_handle}",
+                params={'partition': str(partition)}
+            ) as response:
+                payload = await response.json()
+                if response.status >= 400:
+                    message = payload.get('message', 'Unknown error')
+                    raise StoredProcedureError(
+                        f"Failed to fetch partition {partition} of statement "
+                        f"{statement_handle} ({response.status}): {message}"
+                    )
+                return payload
+        except aiohttp.ClientError as e:
+            raise SnowflakeConnectionError(f"Failed to reach Snowflake API: {e}")
+
+    async def _collect_rows(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build the full row list for a response, following partitions.
+
+        Large results are split into partitions (resultSetMetaData.
+        partitionInfo) and the response body inlines only the first; the
+        rest are downloaded concurrently (at most max_parallel_chunks in
+        flight) and appended in partition order.
+        """
+        metadata = payload.get('resultSetMetaData') or {}
+        columns = [col['name'] for col in metadata.get('rowType', [])]
+        rows = [dict(zip(columns, row)) for row in payload.get('data') or []]
+
+        partitions = metadata.get('partitionInfo') or []
+        if len(partitions) > 1:
+            statement_handle = payload['statementHandle']
+            semaphore = asyncio.Semaphore(self.max_parallel_chunks)
+
+            async def fetch(index: int) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._get_partition(statement_handle, index)
+
+            tasks = [asyncio.ensure_future(fetch(i))
+                     for i in range(1, len(partitions))]
+            try:
+                for task in tasks:
+                    part = await task
+                    rows.extend(dict(zip(columns, row))
+                                for row in part.get('data') or [])
+            finally:
+                for task in tasks:
+                    task.cancel()
+        return rows
+
+    async def _post_body(self,
+                         body: Dict[str, Any],
+                         request_params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """POST a request body (dict or pre-encoded bytes) to /statements."""
+        if self.session is None or self.session.closed:
+            raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
+
+        # Compress large bodies (batched statements, wide parameter lists);
+        # JSON compresses well enough that upload time drops with it
+        data = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8')
+        headers = None
+        if len(data) > _GZIP_THRESHOLD:
+            data = gzip.compress(data)
+            headers = {'Content-Encoding': 'gzip'}
+
+        try:
+            async with self.session.post(
+                f"{self.base_url}/statements",
+                params=request_params,
+                data=data,
+                headers=headers
+            ) as response:
+                if response.status == 401:
+                    raise AuthenticationError(
+                        f"Authentication failed: {await response.text()}"
+                    )
+                payload = await response.json()
+                if response.status >= 400:
+                    message = payload.get('message', 'Unknown error')
+                    raise StoredProcedureError(
+                        f"Snowflake API error ({response.status}): {message}"
+                    )
+                return payload
+        except aiohttp.ClientError as e:
+            raise SnowflakeConnectionError(f"Failed to reach Snowflake API: {e}")
+
+    async def _post_statement(self, statement: str) -> Dict[str, Any]:
+        """POST a statement to the SQL API and return the parsed JSON payload."""
+        return await self._post_body(self._build_statement_body(statement))
+
+    @staticmethod
+    def _format_parameter(value: Any) -> str:
+        """Render a Python value as a SQL literal for a CALL statement."""
+        if value is None:
+            return 'NULL'
+        if isinstance(value, bool):
+            return 'TRUE' if value else 'FALSE'
+        if isinstance(value, (int, float)):
+            return str(value)
+        escaped = str(value).replace("'", "''")
+        return f"'{escaped}'"
+
+    def _build_call_statement(self,
+                              procedure_name: str,
+                              parameters: Optional[List[Any]] = None) -> str:
+        """Build a CALL statement with inline literal parameters."""
+        if parameters:
+            args = ', '.join(self._format_parameter(p) for p in parameters)
+            return f"CALL {procedure_name}({args})"
+        return f"CALL {procedure_name}()"
+
+    async def call_stored_procedure_async(self,
+                                          procedure_name: str,
+                                          parameters: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Call a stored procedure and return the results.
+
+        Args:
+            procedure_name: Name of the stored procedure to call
+            parameters: List of parameters to pass to the stored procedure
+
+        Returns:
+            List of dictionaries containing the results
+
+        Raises:
+            SnowflakeConnectionError: If not connected
+            StoredProcedureError: If procedure execution fails
+        """
+        call_statement = self._build_call_statement(procedure_name, parameters)
+        self.logger.info(f"Executing: {call_statement}")
+        payload = await self._post_statement(call_statement)
+        results = await self._collect_rows(payload)
+        self.logger.info(f"Successfully executed stored procedure {procedure_name}, returned {len(results)} rows")
+        return results
+
+    async def call_sp_example_async(self,
+                                    parameters: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Convenience method to call the sp_example stored procedure.
+
+        The no-argument case — the CLI default — reuses a request body that
+        is JSON-encoded once per client instead of rebuilt on every call.
+
+        Args:
+            parameters: List of parameters to pass to sp_example
+
+        Returns:
+            List of dictionaries containing the results
+        """
+        if parameters:
+            return await self.call_stored_procedure_async("sp_example", parameters)
+
+        if self._sp_example_body is None:
+            self._sp_example_body = json.dumps(
+                self._build_statement_body("CALL sp_example()")
+            ).encode('utf-8')
+
+        self.logger.info("Executing: CALL sp_example()")
+        payload = await self._post_body(self._sp_example_body)
+        results = await self._collect_rows(payload)
+        self.logger.info(f"Successfully executed stored procedure sp_example, returned {len(results)} rows")
+        return results
+
+    async def execute_query_async(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Execute a SQL query and return results.
+
+        Args:
+            query: SQL query to execute
+
+        Returns:
+            List of dictionaries containing the results
+
+        Raises:
+            SnowflakeConnectionError: If not connected
+            StoredProcedureError: If query execution fails
+        """
+        self.logger.info(f"Executing query: {query}")
+        payload = await self._post_statement(query)
+        results = await self._collect_rows(payload)
+        self.logger.info(f"Query executed successfully, returned {len(results)} rows")
+        return results
+
+    @staticmethod
+    def _require_pyarrow():
+        """Import pyarrow, raising a helpful error if it is not installed."""
+        try:
+            import pyarrow
+            return pyarrow
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for Arrow result streaming. "
+                "Install it with: pip install pyarrow"
+            )
+
+    async def iter_record_batches(self, statement: str):
+        """
+        Execute a statement and yield results as pyarrow.RecordBatch objects.
+
+        Instead of materializing the whole result as one list of dicts, each
+        result partition is converted to a RecordBatch as it arrives, keeping
+        peak memory at O(partition) instead of O(rows). Later partitions
+        download (at most max_parallel_chunks in flight) while earlier ones
+        are being consumed.
+
+        Args:
+            statement: SQL statement (or CALL statement) to execute
+
+        Yields:
+            pyarrow.RecordBatch objects, one per non-empty result partition
+
+        Raises:
+            SnowflakeConnectionError: If not connected
+            StoredProcedureError: If statement execution fails
+            ImportError: If pyarrow is not installed
+        """
+        pa = self._require_pyarrow()
+
+        if self.session is None or self.session.closed:
+            raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
+
+        self.logger.info(f"Executing (arrow): {statement}")
+        payload = await self._post_statement(statement)
+
+        metadata = payload.get('resultSetMetaData') or {}
+        columns = [col['name'] for col in metadata.get('rowType', [])]
+
+        def to_batch(data: List[List[Any]]):
+            return pa.RecordBatch.from_pylist(
+                [dict(zip(columns, row)) for row in data]
+            )
+
+        first = payload.get('data') or []
+        if first:
+            yield to_batch(first)
+
+        partitions = metadata.get('partitionInfo') or []
+        if len(partitions) > 1:
+            statement_handle = payload['statementHandle']
+            semaphore = asyncio.Semaphore(self.max_parallel_chunks)
+
+            async def fetch(index: int) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._get_partition(statement_handle, index)
+
+            tasks = [asyncio.ensure_future(fetch(i))
+                     for i in range(1, len(partitions))]
+            try:
+                for task in tasks:
+                    part = await task
+                    data = part.get('data') or []
+                    if data:
+                        yield to_batch(data)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    async def submit(self, statement: str) -> QueryHandle:
+        """
+        Submit a statement with asyncExec=true and return immediately.
+
+        The HTTP connection is released as soon as Snowflake accepts the
+        statement, so long-running procedures do not hold the client open.
+        Use wait_result() to poll for completion.
+
+        Args:
+            statement: SQL statement (or CALL statement) to submit
+
+        Returns:
+            QueryHandle for the in-flight statement
+        """
+        if self.session is None or self.session.closed:
+            raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
+
+        request_id = str(uuid.uuid4())
+        body = self._build_statement_body(statement)
+        body['asyncExec'] = True
+        self.logger.info(f"Submitting async: {statement}")
+        payload = await self._post_body(body, {'requestId': request_id})
+
+        handle = QueryHandle(payload['statementHandle'], request_id)
+        self.logger.info(f"Statement accepted, handle: {handle.statement_handle}")
+        return handle
+
+    async def wait_result(self,
+                          handle: QueryHandle,
+                          timeout: Optional[float] = None,
+                          poll_interval: float = 0.5,
+                          max_poll_interval: float = 8.0) -> List[Dict[str, Any]]:
+        """
+        Poll a submitted statement until it completes and return its results.
+
+        Args:
+            handle: QueryHandle (or raw statement handle string) from submit()
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            poll_interval: Initial delay between polls (doubles up to max_poll_interval)
+            max_poll_interval: Upper bound on the polling delay
+
+        Returns:
+            List of dictionaries containing the results
+
+        Raises:
+            StoredProcedureError: If the statement fails or the timeout expires
+        """
+        if self.session is None or self.session.closed:
+            raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
+
+        statement_handle = getattr(handle, 'statement_handle', handle)
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        delay = poll_interval
+
+        while True:
+            try:
+                async with self.session.get(
+                    f"{self.base_url}/statements/{statement_handle}"
+                ) as response:
+                    payload = await response.json()
+                    code = str(payload.get('code', ''))
+                    if response.status == 200 and code not in _RUNNING_CODES:
+                        results = await self._collect_rows(payload)
+                        self.logger.info(f"Statement {statement_handle} completed, returned {len(results)} rows")
+                        return results
+                    if response.status >= 400:
+                        message = payload.get('message', 'Unknown error')
+                        raise StoredProcedureError(
+                            f"Statement {statement_handle} failed ({response.status}): {message}"
+                        )
+            except aiohttp.ClientError as e:
+                raise SnowflakeConnectionError(f"Failed to reach Snowflake API: {e}")
+
+            if deadline is not None and loop.time() >= deadline:
+                raise StoredProcedureError(
+                    f"Timed out waiting for statement {statement_handle}"
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+
+    async def cancel(self, handle: QueryHandle) -> None:
+        """
+        Cancel a submitted statement.
+
+        Args:
+            handle: QueryHandle (or raw statement handle string) from submit()
+        """
+        if self.session is None or self.session.closed:
+            raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
+
+        statement_handle = getattr(handle, 'statement_handle', handle)
+        try:
+            async with self.session.post(
+                f"{self.base_url}/statements/{statement_handle}/cancel"
+            ) as response:
+                if response.status >= 400:
+                    payload = await response.json()
+                    message = payload.get('message', 'Unknown error')
+                    raise StoredProcedureError(
+                        f"Failed to cancel statement {statement_handle}: {message}"
+                    )
+                self.logger.info(f"Cancelled statement {statement_handle}")
+        except aiohttp.ClientError as e:
+            raise SnowflakeConnectionError(f"Failed to reach Snowflake API: {e}")
+
+    async def call_stored_procedure_submit(self,
+                                           procedure_name: str,
+                                           parameters: Optional[List[Any]] = None) -> QueryHandle:
+        """
+        Submit a stored procedure call with asyncExec=true.
+
+        Args:
+            procedure_name: Name of the stored procedure to call
+            parameters: List of parameters to pass to the stored procedure
+
+        Returns:
+            QueryHandle to pass to wait_result() or cancel()
+        """
+        return await self.submit(self._build_call_statement(procedure_name, parameters))
+
+    async def call_batch(self,
+                         calls: List[Tuple[str, Optional[List[Any]]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Call several stored procedures in one multi-statement request.
+
+        The calls are joined into a single statement with
+        MULTI_STATEMENT_COUNT set, so the whole batch costs one HTTPS
+        round-trip instead of one per procedure.
+
+        Args:
+            calls: List of (procedure_name, parameters) tuples
+
+        Returns:
+            List of result sets, one per call, in the same order as `calls`
+        """
+        statements = [self._build_call_statement(name, params) for name, params in calls]
+        body = self._build_statement_body(';\n'.join(statements))
+        body['parameters'] = {'MULTI_STATEMENT_COUNT': str(len(calls))}
+        self.logger.info(f"Executing batch of {len(calls)} stored procedure calls")
+        payload = await self._post_body(body)
+
+        handles = payload.get('statementHandles')
+        if not handles:
+            # Single combined result (or empty batch)
+            return [await self._collect_rows(payload)]
+        return [await self.wait_result(handle) for handle in handles]
+
+    async def gather_procedures(self,
+                                calls: List[Tuple[str, Optional[List[Any]]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Call several stored procedures concurrently over one HTTP session.
+
+        Args:
+            calls: List of (procedure_name, parameters) tuples
+
+        Returns:
+            List of result sets, one per call, in the same order as `calls`
+        """
+        return await asyncio.gather(
+            *[self.call_stored_procedure_async(name, params) for name, params in calls]
+        )
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.disconnect()
@@ -3,12 +3,14 @@ Command Line Interface for the Snowflake REST Calls library.
 """
 
 import argparse
+import asyncio
+import io
 import json
+import re
 import sys
 import logging
 import os
 from typing import List, Any, Optional
-from .snowflake_client import SnowflakeClient
 from .exceptions import (
     SnowflakeConnectionError, 
     StoredProcedureError, 
@@ -18,14 +20,26 @@ from .exceptions import (
 
 
 def setup_logging(verbose: bool = False) -> None:
-    """Set up logging configuration."""
+    """Set up logging configuration. Safe to call more than once."""
     level = logging.DEBUG if verbose else logging.INFO
+    root = logging.getLogger()
+    if root.handlers:
+        # Already configured (library use, repeated CLI entry): only adjust
+        # the level rather than stacking another handler
+        root.setLevel(level)
+        return
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
 
+# Parameter tokenizer, compiled once at import: a token is any run of
+# quoted strings, bracketed JSON arrays/objects, or plain non-comma text,
+# so commas inside '"x,y"' or '[1,2,3]' don't split the token
+_PARAM_TOKEN_RE = re.compile(r'(?:"[^"]*"|\[[^\]]*\]|\{[^}]*\}|[^,"\[{])+')
+
+
 def parse_parameters(param_string: Optional[str]) -> Optional[List[Any]]:
     """
     Parse parameter string into a list of values.
@@ -38,44 +52,166 @@ def parse_parameters(param_string: Optional[str]) -> Optional[List[Any]]:
     """
     if not param_string:
         return None
-    
-    # Split by comma and strip whitespace
-    params = [param.strip() for param in param_string.split(',')]
-    
-    # Try to convert to appropriate types
+
+    # Fast path: parse the whole comma-separated list as one JSON array,
+    # a single parser call instead of one call (and exception) per token
+    try:
+        return json.loads('[' + param_string + ']')
+    except json.JSONDecodeError:
+        pass
+
+    # Fallback for bare-string tokens: tokenize (quote- and bracket-aware),
+    # then try to convert each token to an appropriate type
+    tokens = _PARAM_TOKEN_RE.findall(param_string)
+    if ','.join(tokens) != param_string:
+        # The tokenizer dropped characters it could not match (e.g. an
+        # unbalanced quote in '19" rack'); fall back to the plain comma
+        # split so no input is silently lost
+        tokens = param_string.split(',')
     parsed_params = []
-    for param in params:
+    for param in (m.strip() for m in tokens):
         # Try to parse as JSON first (for complex types)
         try:
-            parsed_param = json.loads(param)
-            parsed_params.append(parsed_param)
+            parsed_params.append(json.loads(param))
         except json.JSONDecodeError:
             # If not JSON, treat as string
             parsed_params.append(param)
-    
+
     return parsed_params
 
 
+# Environment variable -> config key mapping, hoisted to module scope so
+# load_config_from_env does a single pass with no per-call setup
+_ENV_MAP = (
+    ('SNOWFLAKE_ACCOUNT', 'account'),
+    ('SNOWFLAKE_USERNAME', 'username'),
+    ('SNOWFLAKE_TOKEN', 'token'),
+    ('SNOWFLAKE_WAREHOUSE', 'warehouse'),
+    ('SNOWFLAKE_DATABASE', 'database'),
+    ('SNOWFLAKE_SCHEMA', 'schema'),
+    ('SNOWFLAKE_ROLE', 'role'),
+)
+
+
 def load_config_from_env() -> dict:
     """Load configuration from environment variables."""
-    config = {}
-    
-    env_mapping = {
-        'SNOWFLAKE_ACCOUNT': 'account',
-        'SNOWFLAKE_USERNAME': 'username', 
-        'SNOWFLAKE_TOKEN': 'token',
-        'SNOWFLAKE_WAREHOUSE': 'warehouse',
-        'SNOWFLAKE_DATABASE': 'database',
-        'SNOWFLAKE_SCHEMA': 'schema',
-        'SNOWFLAKE_ROLE': 'role'
-    }
-    
-    for env_var, config_key in env_mapping.items():
-        value = os.getenv(env_var)
-        if value:
-            config[config_key] = value
-    
-    return config
+    env = os.environ
+    return {config_key: env[env_var] for env_var, config_key in _ENV_MAP if env.get(env_var)}
+
+
+def _to_rows(results) -> List[dict]:
+    """Convert Arrow tables/record batches to row dicts; pass lists through."""
+    if not isinstance(results, list):
+        return results.to_pylist()
+    return results
+
+
+def _format_json(results) -> str:
+    """Format results as indented JSON."""
+    return json.dumps(_to_rows(results), indent=2, default=str)
+
+
+def _format_table(results) -> str:
+    """Format results as a simple tab-separated table."""
+    results = _to_rows(results)
+    if not results:
+        return "No results returned.\n"
+    headers = list(results[0].keys())
+    # Buffered writer keeps this linear in the output size; += on a string
+    # re-allocates the whole output for every row
+    buf = io.StringIO()
+    buf.write('\t'.join(headers))
+    buf.write('\n')
+    buf.writelines(
+        '\t'.join(str(row.get(header, '')) for header in headers) + '\n'
+        for row in results
+    )
+    return buf.getvalue()
+
+
+def _format_csv(results) -> str:
+    """Format results as CSV, using pyarrow's vectorized writer if available."""
+    if isinstance(results, list) and not results:
+        return ""
+    try:
+        # Vectorized CSV writer: escaping and encoding happen in
+        # Arrow's native code instead of a per-row Python loop. Arrow
+        # tables and record batches are written as-is, columnar buffers
+        # straight to CSV without ever building per-row dicts
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        if isinstance(results, pa.RecordBatch):
+            table = pa.Table.from_batches([results])
+        elif isinstance(results, pa.Table):
+            table = results
+        else:
+            table = pa.Table.from_pylist(results)
+        output_buffer = io.BytesIO()
+        pa_csv.write_csv(
+            table, output_buffer,
+            write_options=pa_csv.WriteOptions(include_header=True)
+        )
+        return output_buffer.getvalue().decode('utf-8')
+    except ImportError:
+        pass
+    except Exception:
+        # pa.Table.from_pylist raises ArrowInvalid on mixed-type columns
+        # (e.g. VARIANT results mixing int and str rows); the row-wise
+        # writer below handles those fine
+        pass
+
+    import csv
+    results = _to_rows(results)
+    if not results:
+        return ""
+    output_buffer = io.StringIO()
+    writer = csv.DictWriter(output_buffer, fieldnames=results[0].keys())
+    writer.writeheader()
+    writer.writerows(results)
+    return output_buffer.getvalue()
+
+
+# Output-format dispatch table; resolved once per invocation instead of
+# re-evaluating an if/elif chain on the request path
+FORMATTERS = {
+    'json': _format_json,
+    'table': _format_table,
+    'csv': _format_csv,
+}
+
+
+def _make_async_client(config: dict, max_parallel_chunks: int = 8) -> "AsyncSnowflakeClient":
+    """Build an AsyncSnowflakeClient from a validated config dict."""
+    # Imported here so --help and config errors skip the aiohttp stack
+    from .async_client import AsyncSnowflakeClient
+    return AsyncSnowflakeClient(
+        account=config['account'],
+        username=config['username'],
+        token=config['token'],
+        warehouse=config.get('warehouse'),
+        database=config.get('database'),
+        schema=config.get('schema'),
+        role=config.get('role'),
+        max_parallel_chunks=max_parallel_chunks
+    )
+
+
+async def _submit_statement(config: dict, args) -> str:
+    """Submit a statement with asyncExec=true and return its handle."""
+    async with _make_async_client(config, args.parallel_chunks) as client:
+        if args.query:
+            handle = await client.submit(args.query)
+        else:
+            parameters = parse_parameters(args.parameters)
+            handle = await client.call_stored_procedure_submit(args.procedure, parameters)
+    return handle.statement_handle
+
+
+async def _fetch_result(config: dict, statement_handle: str,
+                        max_parallel_chunks: int = 8) -> List[dict]:
+    """Poll a previously submitted statement until it completes."""
+    async with _make_async_client(config, max_parallel_chunks) as client:
+        return await client.wait_result(statement_handle)
 
 
 def main():
@@ -108,7 +244,17 @@ def main():
                        help='Comma-separated parameters to pass to the stored procedure')
     parser.add_argument('--query', '-q',
                        help='SQL query to execute instead of calling stored procedure')
-    
+    parser.add_argument('--async', dest='submit_async',
+                       action='store_true',
+                       help='Submit the statement asynchronously and print its handle')
+    parser.add_argument('--result',
+                       metavar='HANDLE',
+                       help='Fetch the result of a previously submitted async statement')
+    parser.add_argument('--parallel-chunks',
+                       type=int,
+                       default=8,
+                       metavar='N',
+                       help='Maximum result chunks to download in parallel (default: 8)')
     # Output options
     parser.add_argument('--output', '-o',
                        choices=['json', 'table', 'csv'],
@@ -148,61 +294,60 @@ def main():
                 f"Provide them via command line arguments or environment variables."
             )
         
-        # Create client
-        client = SnowflakeClient(
-            account=config['account'],
-            username=config['username'],
-            token=config['token'],
-            warehouse=config.get('warehouse'),
-            database=config.get('database'),
-            schema=config.get('schema'),
-            role=config.get('role')
-        )
-        
-        # Connect and execute
-        with client:
-            if args.query:
-                logger.info(f"Executing query: {args.query}")
-                results = client.execute_query(args.query)
-            else:
-                parameters = parse_parameters(args.parameters)
-                logger.info(f"Calling stored procedure: {args.procedure}")
-                if parameters:
-                    logger.info(f"Parameters: {parameters}")
-                results = client.call_stored_procedure(args.procedure, parameters)
-            
-            # Format output
-            if args.output == 'json':
-                output = json.dumps(results, indent=2, default=str)
-            elif args.output == 'table':
-                if results:
-                    # Simple table format
-                    headers = list(results[0].keys())
-                    output = '\t'.join(headers) + '\n'
-                    for row in results:
-                        output += '\t'.join(str(row.get(header, '')) for header in headers) + '\n'
-                else:
-                    output = "No results returned.\n"
-            elif args.output == 'csv':
-                if results:
-                    import csv
-                    import io
-                    output_buffer = io.StringIO()
-                    writer = csv.DictWriter(output_buffer, fieldnames=results[0].keys())
-                    writer.writeheader()
-                    writer.writerows(results)
-                    output = output_buffer.getvalue()
+        # Async submission: print the statement handle and exit
+        if args.submit_async:
+            handle = asyncio.run(_submit_statement(config, args))
+            print(handle)
+            logger.info(f"Statement submitted. Fetch results with: --result {handle}")
+            return
+
+        if args.result:
+            # Fetch results of a previously submitted statement
+            logger.info(f"Fetching result for statement: {args.result}")
+            results = asyncio.run(_fetch_result(config, args.result, args.parallel_chunks))
+        else:
+            # Imported here so --help and config errors skip the connector stack
+            from .snowflake_client import SnowflakeClient
+
+            # Create client. No ResultCache: the CLI is one-shot, so an
+            # in-memory cache can never hit; long-lived callers can pass
+            # one to SnowflakeClient directly
+            client = SnowflakeClient(
+                account=config['account'],
+                username=config['username'],
+                token=config['token'],
+                warehouse=config.get('warehouse'),
+                database=config.get('database'),
+                schema=config.get('schema'),
+                role=config.get('role')
+            )
+
+            # Connect and execute
+            with client:
+                if args.query:
+                    logger.info(f"Executing query: {args.query}")
+                    results = client.execute_query(args.query)
                 else:
-                    output = ""
-            
-            # Write output
-            if args.file:
-                with open(args.file, 'w') as f:
-                    f.write(output)
-                logger.info(f"Output written to {args.file}")
-            else:
-                print(output)
-        
+                    parameters = parse_parameters(args.parameters)
+                    logger.info(f"Calling stored procedure: {args.procedure}")
+                    if parameters:
+                        logger.info(f"Parameters: {parameters}")
+                    results = client.call_stored_procedure(args.procedure, parameters)
+
+        # Format output
+        output = FORMATTERS[args.output](results)
+
+        # Write output
+        if args.file:
+            # Binary mode with a 1MB buffer skips the TextIOWrapper codec
+            # layer and cuts syscalls for multi-MB CSV/JSON outputs
+            data = output if isinstance(output, (bytes, bytearray)) else output.encode('utf-8')
+            with open(args.file, 'wb', buffering=1 << 20) as f:
+                f.write(data)
+            logger.info(f"Output written to {args.file}")
+        else:
+            print(output)
+
         logger.info("Operation completed successfully")
         
     except ConfigurationError as e:
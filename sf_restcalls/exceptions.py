@@ -1,23 +1,34 @@
 """
 Custom exceptions for the Snowflake REST Calls library.
+
+All exceptions share the SfRestError base (so callers can catch the whole
+family with one except clause) and declare empty __slots__ so subclasses
+add no per-class attribute storage of their own. Note that instances still
+carry a __dict__ — BaseException provides one — so this is about keeping
+the hierarchy lean, not about per-instance memory savings.
 """
 
 
-class SnowflakeConnectionError(Exception):
-    """Raised when there's an error connecting to Snowflake."""
-    pass
+class SfRestError(Exception):
+    """Base class for all sf_restcalls errors."""
+    __slots__ = ()
 
 
-class StoredProcedureError(Exception):
-    """Raised when there's an error executing a stored procedure."""
-    pass
+class SnowflakeConnectionError(SfRestError):
+    """Raised when there's an error connecting to Snowflake."""
+    __slots__ = ()
 
 
-class AuthenticationError(Exception):
+class AuthenticationError(SnowflakeConnectionError):
     """Raised when there's an authentication error with the PAT token."""
-    pass
+    __slots__ = ()
+
+
+class StoredProcedureError(SfRestError):
+    """Raised when there's an error executing a stored procedure."""
+    __slots__ = ()
 
 
-class ConfigurationError(Exception):
+class ConfigurationError(SfRestError):
     """Raised when there's a configuration error."""
-    pass
+    __slots__ = ()
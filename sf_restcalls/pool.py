@@ -0,0 +1,157 @@
+"""
+Pool of authenticated SnowflakeClient instances for multi-thread workloads.
+"""
+
+import contextlib
+import logging
+import queue
+import threading
+import time
+from typing import Optional
+
+from .snowflake_client import SnowflakeClient
+
+
+class SnowflakeClientPool:
+    """
+    A thread-safe pool of connected SnowflakeClient instances.
+
+    Each client in the pool keeps its Snowflake session alive between uses,
+    so the PAT authentication round-trip is paid once per pooled client
+    instead of once per call. Clients left idle longer than `idle_timeout`
+    seconds are disconnected by a background reaper.
+    """
+
+    def __init__(self, size: int = 8, idle_timeout: float = 300.0, **client_kwargs):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Maximum number of concurrently connected clients
+            idle_timeout: Seconds an idle client may sit in the pool before
+                          being disconnected
+            **client_kwargs: Arguments passed to SnowflakeClient (account,
+                             username, token, warehouse, ...)
+        """
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._client_kwargs = client_kwargs
+        # LIFO so the most recently used (warmest) client is handed out first
+        self._idle: "queue.LifoQueue[tuple]" = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Timer] = None
+        self.logger = logging.getLogger(__name__)
+
+    @contextlib.contextmanager
+    def acquire(self):
+        """
+        Check out a connected client, returning it to the pool afterwards.
+
+        Usage:
+            with pool.acquire() as client:
+                client.call_sp_example()
+        """
+        client = self._checkout()
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def _checkout(self) -> SnowflakeClient:
+        """Pop an idle client, or create one if the pool is not yet full."""
+        try:
+            client, _ = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._created < self.size:
+                    self._created += 1
+                    client = SnowflakeClient(**self._client_kwargs)
+                else:
+                    client = None
+            if client is None:
+                # Pool exhausted: block until another thread releases one
+                client, _ = self._idle.get()
+
+        if not client.is_connected():
+            try:
+                client.connect()
+            except Exception:
+                # Give the slot back: without this, repeated connect
+                # failures would shrink the pool until acquire() blocks
+                # forever on an empty queue
+                with self._lock:
+                    self._created -= 1
+                raise
+        return client
+
+    def release(self, client: SnowflakeClient) -> None:
+        """Return a client to the pool for reuse."""
+        self._idle.put((client, time.monotonic()))
+        self._schedule_reap()
+
+    def _schedule_reap(self) -> None:
+        """Arm the idle-client reaper if it is not already running."""
+        with self._lock:
+            if self._reaper is None:
+                self._reaper = threading.Timer(self.idle_timeout, self._reap_idle)
+                self._reaper.daemon = True
+                self._reaper.start()
+
+    def _reap_idle(self) -> None:
+        """Disconnect clients that have been idle longer than idle_timeout."""
+        with self._lock:
+            self._reaper = None
+        cutoff = time.monotonic() - self.idle_timeout
+        keep = []
+        while True:
+            try:
+                client, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if released_at < cutoff:
+                # close(), not disconnect(): the latter parks the session
+                # in the module-level connection pool, which would keep it
+                # alive past the idle_timeout this reaper enforces
+                client.close()
+                with self._lock:
+                    self._created -= 1
+                self.logger.info("Reaped idle pooled client")
+            else:
+                keep.append((client, released_at))
+        for entry in keep:
+            self._idle.put(entry)
+        if keep:
+            self._schedule_reap()
+
+    def close_all(self) -> None:
+        """Disconnect every idle client and cancel the reaper."""
+        with self._lock:
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+        while True:
+            try:
+                client, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            client.close()
+            with self._lock:
+                self._created -= 1
+
+
+_pool: Optional[SnowflakeClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(size: int = 8, idle_timeout: float = 300.0, **client_kwargs) -> SnowflakeClientPool:
+    """
+    Return the process-wide client pool, creating it on first use.
+
+    Subsequent calls return the existing pool regardless of arguments.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SnowflakeClientPool(size=size, idle_timeout=idle_timeout, **client_kwargs)
+        return _pool
@@ -0,0 +1,75 @@
+"""
+Client-side result cache for idempotent Snowflake queries.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# Snowflake keeps query results in its server-side result cache for 24 hours,
+# so a longer client-side TTL would serve results Snowflake itself re-executes
+DEFAULT_TTL = 86400
+
+
+class ResultCache:
+    """
+    A small TTL + LRU cache for query and stored procedure results.
+
+    Results are keyed by a hash of the SQL text, its parameters, and the
+    session context (warehouse/database/schema/role), so identical idempotent
+    reads can skip the Snowflake round-trip entirely. Entries expire after
+    `ttl` seconds (capped at Snowflake's 24h result cache window) and the
+    least recently used entry is evicted once `maxsize` is reached.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = DEFAULT_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached result sets
+            ttl: Time-to-live in seconds for each entry (max 86400)
+        """
+        self.maxsize = maxsize
+        self.ttl = min(ttl, DEFAULT_TTL)
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(sql: str,
+                 parameters: Optional[List[Any]] = None,
+                 context: str = '') -> bytes:
+        """Build a cache key from SQL text, parameters, and session context."""
+        raw = f"{sql}|{parameters!r}|{context}".encode('utf-8')
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached result set for `key`, or None if absent/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, results = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            # Copy the rows, not just the list: sharing the row dicts
+            # would let a caller's mutation corrupt the cached entry
+            return [dict(row) for row in results]
+
+    def put(self, key: bytes, results: List[Dict[str, Any]]) -> None:
+        """Store a result set under `key`, evicting the LRU entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl,
+                                  [dict(row) for row in results])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
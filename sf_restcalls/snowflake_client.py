@@ -2,15 +2,35 @@
 Snowflake client for connecting with PAT tokens and executing stored procedures.
 """
 
+import asyncio
+import functools
+import time
 import snowflake.connector
 from typing import Dict, Any, List, Optional
 import logging
 from .exceptions import (
-    SnowflakeConnectionError, 
-    StoredProcedureError, 
+    SnowflakeConnectionError,
+    StoredProcedureError,
     AuthenticationError,
     ConfigurationError
 )
+from .result_cache import ResultCache
+from . import _pool
+
+
+# Connector errnos that mean the credential (not the connection) is bad:
+# invalid credentials, expired/blocked token variants, plus the OAuth
+# codes (390303 invalid token, 390318 expired token) this client's
+# authenticator='oauth' + PAT login actually surfaces
+_AUTH_ERRNOS = frozenset({390100, 390101, 390104, 390114, 390303, 390318})
+
+
+@functools.lru_cache(maxsize=256)
+def _call_sql(procedure_name: str, arity: int) -> str:
+    """Build (and memoize) the CALL statement for a procedure and arity."""
+    if arity:
+        return f"CALL {procedure_name}({', '.join(['%s'] * arity)})"
+    return f"CALL {procedure_name}()"
 
 
 class SnowflakeClient:
@@ -25,10 +45,14 @@ class SnowflakeClient:
                  warehouse: Optional[str] = None,
                  database: Optional[str] = None,
                  schema: Optional[str] = None,
-                 role: Optional[str] = None):
+                 role: Optional[str] = None,
+                 cache: Optional[ResultCache] = None,
+                 prefetch_threads: int = 4,
+                 result_chunk_size_mb: Optional[int] = 16,
+                 session_keep_alive: bool = True):
         """
         Initialize the Snowflake client.
-        
+
         Args:
             account: Snowflake account identifier
             username: Snowflake username
@@ -37,6 +61,15 @@ class SnowflakeClient:
             database: Snowflake database (optional)
             schema: Snowflake schema (optional)
             role: Snowflake role (optional)
+            cache: Optional ResultCache; identical queries within its TTL
+                   are served locally without a Snowflake round-trip
+            prefetch_threads: Connector threads downloading result chunks in
+                              parallel with decoding
+            result_chunk_size_mb: CLIENT_RESULT_CHUNK_SIZE for the session;
+                                  smaller chunks bound peak memory on wide
+                                  scans. None leaves the account default
+            session_keep_alive: Keep the session alive between uses (needed
+                                for connection pooling)
         """
         self.account = account
         self.username = username
@@ -45,27 +78,75 @@ class SnowflakeClient:
         self.database = database
         self.schema = schema
         self.role = role
+        self.cache = cache
+        self.prefetch_threads = prefetch_threads
+        self.result_chunk_size_mb = result_chunk_size_mb
+        self.session_keep_alive = session_keep_alive
         self.connection = None
+        self._is_connected = False
+        self._last_used = 0.0
         
         # Set up logging
         self.logger = logging.getLogger(__name__)
         
+    def _pool_key(self) -> tuple:
+        """
+        Key identifying interchangeable connections in the pool.
+
+        Includes the PAT so a pooled session (and the session/master
+        tokens it already negotiated) is only ever handed to a client
+        holding the same credential, and the session tuning knobs
+        (prefetch threads, result chunk size, keep-alive) that are baked
+        into a session at connect time — a client asking for different
+        tuning must not silently adopt a session configured otherwise.
+        """
+        return (self.account, self.username, self.token, self.warehouse,
+                self.role, self.database, self.schema,
+                self.prefetch_threads, self.result_chunk_size_mb,
+                self.session_keep_alive)
+
     def connect(self) -> None:
         """
         Establish connection to Snowflake using PAT token.
-        
+
+        An idle pooled connection with the same account/user/context is
+        reused when available; otherwise a new session is opened (with
+        keep-alive enabled so it stays valid while pooled).
+
         Raises:
             SnowflakeConnectionError: If connection fails
             AuthenticationError: If authentication fails
         """
+        pooled = _pool.acquire(self._pool_key())
+        if pooled is not None:
+            self.connection = pooled
+            self._is_connected = True
+            self._last_used = time.monotonic()
+            self.logger.info("Reusing pooled Snowflake connection")
+            return
+
         try:
             connection_params = {
                 'account': self.account,
                 'user': self.username,
                 'token': self.token,
                 'authenticator': 'oauth',
+                # Overlap chunk downloads with decoding
+                'client_prefetch_threads': self.prefetch_threads,
+                # Serve identical repeat queries from the server-side
+                # result cache (default-on, but explicit in case the
+                # account disables it) and widen result prefetch
+                'session_parameters': {
+                    'USE_CACHED_RESULT': True,
+                    'CLIENT_RESULT_PREFETCH_THREADS': 4,
+                    'CLIENT_RESULT_PREFETCH_SLOTS': 4,
+                },
             }
-            
+            if self.session_keep_alive:
+                # Keep pooled sessions alive between uses
+                connection_params['client_session_keep_alive'] = True
+                connection_params['client_session_keep_alive_heartbeat_frequency'] = 900
+
             # Add optional parameters if provided
             if self.warehouse:
                 connection_params['warehouse'] = self.warehouse
@@ -75,29 +156,81 @@ class SnowflakeClient:
                 connection_params['schema'] = self.schema
             if self.role:
                 connection_params['role'] = self.role
-                
-            self.logger.info(f"Connecting to Snowflake account: {self.account}")
+
+            self.logger.info("Connecting to Snowflake account: %s", self.account)
             self.connection = snowflake.connector.connect(**connection_params)
+
+            if self.result_chunk_size_mb is not None:
+                # Bound per-chunk memory for wide scans; once per new session
+                cursor = self.connection.cursor()
+                cursor.execute(
+                    f"ALTER SESSION SET CLIENT_RESULT_CHUNK_SIZE = {int(self.result_chunk_size_mb)}"
+                )
+                cursor.close()
+
+            self._is_connected = True
+            self._last_used = time.monotonic()
             self.logger.info("Successfully connected to Snowflake")
-            
+
         except snowflake.connector.errors.DatabaseError as e:
-            if "authentication" in str(e).lower():
+            # Dispatch on the connector errno rather than scanning the
+            # message text, which may be localized
+            if getattr(e, 'errno', None) in _AUTH_ERRNOS:
                 raise AuthenticationError(f"Authentication failed: {e}")
             else:
                 raise SnowflakeConnectionError(f"Failed to connect to Snowflake: {e}")
         except Exception as e:
             raise SnowflakeConnectionError(f"Unexpected error connecting to Snowflake: {e}")
-    
+
     def disconnect(self) -> None:
-        """Close the Snowflake connection."""
+        """Return the connection to the pool (closing it if the pool is full)."""
+        self._is_connected = False
         if self.connection:
-            self.connection.close()
+            if _pool.release(self._pool_key(), self.connection):
+                self.logger.info("Returned Snowflake connection to the pool")
+            else:
+                self.connection.close()
+                self.logger.info("Disconnected from Snowflake")
             self.connection = None
+
+    def close(self) -> None:
+        """
+        Close the underlying connection for real, bypassing the pool.
+
+        Use this when the session must actually end (idle reaping,
+        shutdown); disconnect() parks the connection for reuse instead.
+        """
+        self._is_connected = False
+        if self.connection:
+            self.connection.close()
             self.logger.info("Disconnected from Snowflake")
+            self.connection = None
     
+    def _cache_key(self, sql: str, parameters: Optional[List[Any]] = None) -> bytes:
+        """Build a result-cache key scoped to this client's session context."""
+        context = f"{self.warehouse}|{self.database}|{self.schema}|{self.role}"
+        return ResultCache.make_key(sql, parameters, context)
+
+    # Idle time after which is_connected() re-verifies with the connector
+    _IDLE_RECHECK_SECONDS = 300.0
+
     def is_connected(self) -> bool:
-        """Check if connected to Snowflake."""
-        return self.connection is not None and not self.connection.is_closed()
+        """
+        Check if connected to Snowflake.
+
+        Tracked with a flag flipped by connect()/disconnect(), so the
+        per-call check avoids the connector-internal is_closed() probe
+        (and the lock it takes). The probe still runs after the
+        connection has sat idle long enough that the session may have
+        been dropped server-side.
+        """
+        if not self._is_connected or self.connection is None:
+            return False
+        now = time.monotonic()
+        if now - self._last_used > self._IDLE_RECHECK_SECONDS:
+            self._is_connected = not self.connection.is_closed()
+        self._last_used = now
+        return self._is_connected
     
     def call_stored_procedure(self, 
                             procedure_name: str, 
@@ -118,32 +251,34 @@ class SnowflakeClient:
         """
         if not self.is_connected():
             raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
-        
+
+        if self.cache is not None:
+            cache_key = self._cache_key(f"CALL {procedure_name}", parameters)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.info("Returning cached results for stored procedure %s", procedure_name)
+                return cached
+
         try:
-            cursor = self.connection.cursor()
-            
-            # Build the CALL statement
+            cursor = self.connection.cursor(snowflake.connector.DictCursor)
+
+            # Build the CALL statement (memoized per procedure and arity)
+            call_statement = _call_sql(procedure_name, len(parameters) if parameters else 0)
             if parameters:
-                # Create parameter placeholders
-                placeholders = ', '.join(['%s'] * len(parameters))
-                call_statement = f"CALL {procedure_name}({placeholders})"
-                self.logger.info(f"Executing: {call_statement} with parameters: {parameters}")
+                self.logger.info("Executing: %s with %d parameters", call_statement, len(parameters))
                 cursor.execute(call_statement, parameters)
             else:
-                call_statement = f"CALL {procedure_name}()"
-                self.logger.info(f"Executing: {call_statement}")
+                self.logger.info("Executing: %s", call_statement)
                 cursor.execute(call_statement)
             
-            # Fetch results
-            results = []
-            if cursor.description:
-                columns = [desc[0] for desc in cursor.description]
-                for row in cursor.fetchall():
-                    row_dict = dict(zip(columns, row))
-                    results.append(row_dict)
-            
+            # DictCursor builds the row dicts inside the connector's
+            # decoding path; iterating streams them out of the chunk buffers
+            results = list(cursor)
+
             cursor.close()
-            self.logger.info(f"Successfully executed stored procedure {procedure_name}, returned {len(results)} rows")
+            self.logger.info("Successfully executed stored procedure %s, returned %d rows", procedure_name, len(results))
+            if self.cache is not None:
+                self.cache.put(cache_key, results)
             return results
             
         except snowflake.connector.errors.ProgrammingError as e:
@@ -151,6 +286,55 @@ class SnowflakeClient:
         except Exception as e:
             raise StoredProcedureError(f"Unexpected error executing stored procedure {procedure_name}: {e}")
     
+    def call_stored_procedure_batch(self,
+                                    procedure_name: str,
+                                    parameter_rows: List[List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Call the same stored procedure once per row of parameters.
+
+        The rows go through cursor.executemany, so the connector prepares the
+        CALL once and bulk-binds every row (staging the binds server-side
+        above its threshold) instead of paying a parse + bind round-trip per
+        invocation.
+
+        Args:
+            procedure_name: Name of the stored procedure to call
+            parameter_rows: One list of parameters per invocation; all rows
+                            must have the same arity
+
+        Returns:
+            List of dictionaries from the last invocation's result set
+
+        Raises:
+            SnowflakeConnectionError: If not connected
+            StoredProcedureError: If execution fails
+        """
+        if not self.is_connected():
+            raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
+
+        if not parameter_rows:
+            return []
+
+        try:
+            cursor = self.connection.cursor(snowflake.connector.DictCursor)
+            # Larger arraysize amortizes result fetches over fewer chunks
+            cursor.arraysize = 1000
+
+            call_statement = _call_sql(procedure_name, len(parameter_rows[0]))
+            self.logger.info("Executing: %s for %d parameter rows", call_statement, len(parameter_rows))
+            cursor.executemany(call_statement, parameter_rows)
+
+            results = list(cursor)
+
+            cursor.close()
+            self.logger.info("Successfully executed batch of %d calls to %s", len(parameter_rows), procedure_name)
+            return results
+
+        except snowflake.connector.errors.ProgrammingError as e:
+            raise StoredProcedureError(f"Error executing stored procedure batch {procedure_name}: {e}")
+        except Exception as e:
+            raise StoredProcedureError(f"Unexpected error executing stored procedure batch {procedure_name}: {e}")
+
     def call_sp_example(self, parameters: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
         """
         Convenience method to call the sp_example stored procedure.
@@ -163,13 +347,16 @@ class SnowflakeClient:
         """
         return self.call_stored_procedure("sp_example", parameters)
     
-    def execute_query(self, query: str) -> List[Dict[str, Any]]:
+    def execute_query(self, query: str,
+                      arraysize: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Execute a SQL query and return results.
-        
+
         Args:
             query: SQL query to execute
-            
+            arraysize: Optional cursor arraysize; small values bound the
+                       client buffer for probes that only need a few rows
+
         Returns:
             List of dictionaries containing the results
             
@@ -179,21 +366,27 @@ class SnowflakeClient:
         """
         if not self.is_connected():
             raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
-        
+
+        if self.cache is not None:
+            cache_key = self._cache_key(query)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.info("Returning cached results for query")
+                return cached
+
         try:
-            cursor = self.connection.cursor()
-            self.logger.info(f"Executing query: {query}")
+            cursor = self.connection.cursor(snowflake.connector.DictCursor)
+            if arraysize is not None:
+                cursor.arraysize = arraysize
+            self.logger.info("Executing query: %s", query)
             cursor.execute(query)
-            
-            results = []
-            if cursor.description:
-                columns = [desc[0] for desc in cursor.description]
-                for row in cursor.fetchall():
-                    row_dict = dict(zip(columns, row))
-                    results.append(row_dict)
-            
+
+            results = list(cursor)
+
             cursor.close()
-            self.logger.info(f"Query executed successfully, returned {len(results)} rows")
+            self.logger.info("Query executed successfully, returned %d rows", len(results))
+            if self.cache is not None:
+                self.cache.put(cache_key, results)
             return results
             
         except snowflake.connector.errors.ProgrammingError as e:
@@ -201,6 +394,231 @@ class SnowflakeClient:
         except Exception as e:
             raise StoredProcedureError(f"Unexpected error executing query: {e}")
     
+    def bulk_insert(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Load rows into a table through an internal stage instead of binds.
+
+        The rows are written to a temporary CSV, uploaded with PUT
+        (auto-compressed, 8 parallel upload threads), and loaded with COPY
+        INTO — the bulk path Snowflake optimizes for, instead of serializing
+        each row over the query protocol.
+
+        Args:
+            table: Target table name
+            rows: List of row dictionaries; all rows must share the same keys
+
+        Returns:
+            The COPY INTO summary rows (file, rows_loaded, errors, ...)
+
+        Raises:
+            SnowflakeConnectionError: If not connected
+            StoredProcedureError: If the upload or load fails
+        """
+        if not self.is_connected():
+            raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
+
+        if not rows:
+            return []
+
+        import csv
+        import os
+        import tempfile
+
+        columns = list(rows[0].keys())
+        stage = '@~/sf_restcalls_stage'
+
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='',
+                                         delete=False, encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writerows(rows)
+            path = f.name
+
+        try:
+            cursor = self.connection.cursor(snowflake.connector.DictCursor)
+            self.logger.info("Staging %d rows for %s", len(rows), table)
+            cursor.execute(
+                f"PUT file://{path} {stage} OVERWRITE=TRUE AUTO_COMPRESS=TRUE PARALLEL=8"
+            )
+            staged_file = f"{stage}/{os.path.basename(path)}.gz"
+            cursor.execute(
+                f"COPY INTO {table} ({', '.join(columns)}) "
+                f"FROM {staged_file} "
+                "FILE_FORMAT=(TYPE=CSV FIELD_OPTIONALLY_ENCLOSED_BY='\"') "
+                "PURGE=TRUE"
+            )
+
+            results = list(cursor)
+            cursor.close()
+            self.logger.info("Bulk loaded %d rows into %s", len(rows), table)
+            return results
+
+        except snowflake.connector.errors.ProgrammingError as e:
+            raise StoredProcedureError(f"Error bulk inserting into {table}: {e}")
+        except Exception as e:
+            raise StoredProcedureError(f"Unexpected error bulk inserting into {table}: {e}")
+        finally:
+            os.unlink(path)
+
+    def execute_multi(self, sql: str) -> List[List[Dict[str, Any]]]:
+        """
+        Execute several ;-separated statements in a single round-trip.
+
+        The whole batch is sent as one multi-statement request, so N
+        statements cost one network round-trip and one compile cycle
+        instead of N.
+
+        Args:
+            sql: Semicolon-separated SQL statements
+
+        Returns:
+            One list of row dictionaries per statement, in statement order
+
+        Raises:
+            SnowflakeConnectionError: If not connected
+            StoredProcedureError: If any statement fails
+        """
+        if not self.is_connected():
+            raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
+
+        try:
+            cursor = self.connection.cursor(snowflake.connector.DictCursor)
+            self.logger.info("Executing multi-statement batch: %s", sql)
+            # num_statements=0 allows any number of statements in the batch
+            cursor.execute(sql, num_statements=0)
+
+            results = []
+            while True:
+                results.append(list(cursor) if cursor.description else [])
+                if cursor.nextset() is None:
+                    break
+
+            cursor.close()
+            self.logger.info("Multi-statement batch returned %d result sets", len(results))
+            return results
+
+        except snowflake.connector.errors.ProgrammingError as e:
+            raise StoredProcedureError(f"Error executing multi-statement batch: {e}")
+        except Exception as e:
+            raise StoredProcedureError(f"Unexpected error executing multi-statement batch: {e}")
+
+    async def call_stored_procedure_async(self,
+                                          procedure_name: str,
+                                          parameters: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Awaitable wrapper around call_stored_procedure.
+
+        The blocking call runs in the default thread pool, so several
+        independent calls can overlap via asyncio.gather — the connector is
+        thread-safe, no protocol change needed.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.call_stored_procedure, procedure_name, parameters
+        )
+
+    async def call_sp_example_async(self,
+                                    parameters: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+        """Awaitable wrapper around call_sp_example."""
+        return await self.call_stored_procedure_async("sp_example", parameters)
+
+    async def execute_query_async(self, query: str) -> List[Dict[str, Any]]:
+        """Awaitable wrapper around execute_query (runs in a worker thread)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.execute_query, query)
+
+    def execute_query_arrow(self, query: str):
+        """
+        Execute a SQL query and yield results as pyarrow.RecordBatch objects.
+
+        Result chunks are decoded straight into Arrow's columnar buffers by
+        the connector, skipping the per-row tuple -> dict boxing that
+        execute_query does in Python. Requires the connector's Arrow extras
+        (pip install "snowflake-connector-python[pandas]").
+
+        Args:
+            query: SQL query to execute
+
+        Yields:
+            pyarrow.RecordBatch objects
+
+        Raises:
+            SnowflakeConnectionError: If not connected
+            StoredProcedureError: If query execution fails
+        """
+        if not self.is_connected():
+            raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
+
+        cursor = self.connection.cursor()
+        try:
+            self.logger.info("Executing query (arrow): %s", query)
+            try:
+                cursor.execute(query)
+                batches = cursor.fetch_arrow_batches()
+            except snowflake.connector.errors.ProgrammingError as e:
+                raise StoredProcedureError(f"Error executing query: {e}")
+
+            for batch in batches:
+                yield batch
+        finally:
+            cursor.close()
+
+    def execute_query_df(self, query: str):
+        """
+        Execute a SQL query and return the results as a pandas DataFrame.
+
+        Args:
+            query: SQL query to execute
+
+        Returns:
+            pandas.DataFrame with the full result set
+
+        Raises:
+            SnowflakeConnectionError: If not connected
+            StoredProcedureError: If query execution fails
+        """
+        import pyarrow as pa
+
+        batches = list(self.execute_query_arrow(query))
+        if not batches:
+            import pandas as pd
+            return pd.DataFrame()
+        return pa.Table.from_batches(batches).to_pandas()
+
+    def iter_query(self, query: str):
+        """
+        Execute a SQL query and yield result rows one at a time.
+
+        Unlike execute_query, rows are never collected into a list, so peak
+        memory stays bounded by the connector's chunk buffers no matter how
+        large the result set is. The cursor is closed when the generator is
+        exhausted or discarded.
+
+        Args:
+            query: SQL query to execute
+
+        Yields:
+            Dictionaries, one per result row
+
+        Raises:
+            SnowflakeConnectionError: If not connected
+            StoredProcedureError: If query execution fails
+        """
+        if not self.is_connected():
+            raise SnowflakeConnectionError("Not connected to Snowflake. Call connect() first.")
+
+        cursor = self.connection.cursor(snowflake.connector.DictCursor)
+        try:
+            self.logger.info("Executing query: %s", query)
+            try:
+                cursor.execute(query)
+            except snowflake.connector.errors.ProgrammingError as e:
+                raise StoredProcedureError(f"Error executing query: {e}")
+
+            if cursor.description:
+                yield from cursor
+        finally:
+            cursor.close()
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
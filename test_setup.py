@@ -4,37 +4,67 @@ Test script to verify Snowflake setup is working correctly.
 
 This script tests both the Python library and the underlying Snowflake configuration
 to ensure everything is set up properly for API access.
+
+All Snowflake-side probes share one client, one session and one
+multi-statement round-trip; only the result checks run per test.
 """
 
+import contextlib
+import io
 import os
 import sys
-from typing import Dict, Any
-
-def load_config() -> Dict[str, str]:
-    """Load configuration from environment variables."""
-    config = {
-        'account': os.getenv('SNOWFLAKE_ACCOUNT'),
-        'username': os.getenv('SNOWFLAKE_USERNAME'),
-        'token': os.getenv('SNOWFLAKE_TOKEN'),
-        'database': os.getenv('SNOWFLAKE_DATABASE'),
-        'schema': os.getenv('SNOWFLAKE_SCHEMA'),
-        'warehouse': os.getenv('SNOWFLAKE_WAREHOUSE'),
-        'role': os.getenv('SNOWFLAKE_ROLE')
-    }
-    return config
-
-def validate_config(config: Dict[str, str]) -> bool:
+from typing import Dict, Any, List, NamedTuple, Optional
+
+# The three diagnostic probes, sent as one multi-statement round-trip
+# (and re-run one by one if the batch fails, so a single broken probe
+# does not hide the diagnostics of the other two)
+PROBE_STATEMENTS = (
+    "SELECT CURRENT_USER(), CURRENT_ROLE(), CURRENT_DATABASE(), CURRENT_SCHEMA(), CURRENT_WAREHOUSE()",
+    # SHOW works without a current database (SNOWFLAKE_DATABASE is
+    # optional); only the name column is read client-side
+    "SHOW PROCEDURES LIKE 'sp_%' LIMIT 50",
+    "CALL sp_example()",
+)
+PROBE_SQL = '; '.join(PROBE_STATEMENTS) + ';'
+
+class SFConfig(NamedTuple):
+    """Connection settings read from the environment."""
+    account: Optional[str]
+    username: Optional[str]
+    token: Optional[str]
+    database: Optional[str]
+    schema: Optional[str]
+    warehouse: Optional[str]
+    role: Optional[str]
+
+# Environment variables backing SFConfig, in field order
+_KEYS = (
+    'SNOWFLAKE_ACCOUNT',
+    'SNOWFLAKE_USERNAME',
+    'SNOWFLAKE_TOKEN',
+    'SNOWFLAKE_DATABASE',
+    'SNOWFLAKE_SCHEMA',
+    'SNOWFLAKE_WAREHOUSE',
+    'SNOWFLAKE_ROLE',
+)
+
+def load_config() -> SFConfig:
+    """Load configuration from environment variables in one pass."""
+    env = os.environ
+    return SFConfig(*(env.get(key) for key in _KEYS))
+
+def validate_config(config: SFConfig) -> bool:
     """Validate that required configuration is present."""
     required = ['account', 'username', 'token']
-    missing = [key for key in required if not config.get(key)]
-    
+    missing = [key for key in required if not getattr(config, key)]
+
     if missing:
         print("❌ Missing required environment variables:")
         for var in missing:
             print(f"   - SNOWFLAKE_{var.upper()}")
         print("\nPlease set these variables and try again.")
         return False
-    
+
     print("✅ Required environment variables are set")
     return True
 
@@ -49,156 +79,142 @@ def test_import():
         print("Make sure the library is installed: pip install -e .")
         return False
 
-def test_connection(config: Dict[str, str]) -> bool:
-    """Test connection to Snowflake."""
-    try:
-        from sf_restcalls import SnowflakeClient
-        
-        print("🔗 Testing Snowflake connection...")
-        
-        client = SnowflakeClient(
-            account=config['account'],
-            username=config['username'],
-            token=config['token'],
-            database=config.get('database'),
-            schema=config.get('schema'),
-            warehouse=config.get('warehouse'),
-            role=config.get('role')
-        )
-        
-        with client:
-            # Test basic query
-            result = client.execute_query("SELECT CURRENT_USER(), CURRENT_ROLE(), CURRENT_DATABASE(), CURRENT_SCHEMA(), CURRENT_WAREHOUSE()")
-            
-            if result:
-                print("✅ Successfully connected to Snowflake")
-                print("📊 Current context:")
-                if result[0]:
-                    print(f"   User: {result[0][0]}")
-                    print(f"   Role: {result[0][1]}")
-                    print(f"   Database: {result[0][2]}")
-                    print(f"   Schema: {result[0][3]}")
-                    print(f"   Warehouse: {result[0][4]}")
-                return True
-            else:
-                print("❌ Connection succeeded but no results returned")
-                return False
-                
-    except Exception as e:
-        print(f"❌ Connection failed: {e}")
+def run_probes(config: SFConfig) -> List[List[Dict[str, Any]]]:
+    """Run the three diagnostic probes in one connection and one round-trip."""
+    from sf_restcalls import SnowflakeClient
+
+    print("🔗 Connecting to Snowflake...")
+
+    client = SnowflakeClient(
+        account=config.account,
+        username=config.username,
+        token=config.token,
+        database=config.database,
+        schema=config.schema,
+        warehouse=config.warehouse,
+        role=config.role
+    )
+
+    with client:
+        try:
+            return client.execute_multi(PROBE_SQL)
+        except Exception as e:
+            # The batch is atomic: one broken probe (e.g. sp_example
+            # missing) aborts all three. Re-run individually so each
+            # test still gets its own diagnostics
+            print(f"⚠️  Probe batch failed ({e}); re-running probes individually")
+            results = []
+            for statement in PROBE_STATEMENTS:
+                try:
+                    results.append(client.execute_query(statement))
+                except Exception as probe_error:
+                    print(f"   ⚠️  Probe failed: {probe_error}")
+                    results.append([])
+            return results
+
+def test_connection(result: List[Dict[str, Any]]) -> bool:
+    """Check the session-context probe results."""
+    if result:
+        print("✅ Successfully connected to Snowflake")
+        print("📊 Current context:")
+        if result[0]:
+            user, role, database, schema, warehouse = list(result[0].values())[:5]
+            print(f"   User: {user}")
+            print(f"   Role: {role}")
+            print(f"   Database: {database}")
+            print(f"   Schema: {schema}")
+            print(f"   Warehouse: {warehouse}")
+        return True
+    else:
+        print("❌ Connection succeeded but no results returned")
         return False
 
-def test_sp_example(config: Dict[str, str]) -> bool:
-    """Test calling the sp_example stored procedure."""
-    try:
-        from sf_restcalls import SnowflakeClient
-        
-        print("🏃 Testing sp_example stored procedure...")
-        
-        client = SnowflakeClient(
-            account=config['account'],
-            username=config['username'],
-            token=config['token'],
-            database=config.get('database'),
-            schema=config.get('schema'),
-            warehouse=config.get('warehouse'),
-            role=config.get('role')
-        )
-        
-        with client:
-            result = client.call_sp_example()
-            
-            if result:
-                print("✅ sp_example executed successfully")
-                print(f"📤 Result: {result}")
-                return True
-            else:
-                print("❌ sp_example returned no results")
-                return False
-                
-    except Exception as e:
-        print(f"❌ sp_example failed: {e}")
+def test_procedures_exist(result: List[Dict[str, Any]]) -> bool:
+    """Check the stored-procedure probe results."""
+    if result:
+        print("✅ Found stored procedures:")
+        for row in result:
+            print(f"   - {row['name']}")
+        return True
+    else:
+        print("⚠️  No stored procedures found matching 'sp_%'")
+        print("💡 Run quick_user_setup.sql to create example procedures")
+        return False
+
+def test_sp_example(result: List[Dict[str, Any]]) -> bool:
+    """Check the sp_example probe results."""
+    if result:
+        print("✅ sp_example executed successfully")
+        print(f"📤 Result: {result}")
+        return True
+    else:
+        print("❌ sp_example returned no results")
         print("💡 Make sure sp_example procedure exists and user has permissions")
         return False
 
-def test_procedures_exist(config: Dict[str, str]) -> bool:
-    """Test that required stored procedures exist."""
+def run_test(test_name: str, test_func) -> bool:
+    """
+    Run a single test function and report its outcome.
+
+    The test's output is accumulated in a buffer and flushed in one
+    write, so each test costs one stdout syscall instead of one per
+    print under CI's line buffering.
+    """
+    buf = io.StringIO()
+    buf.write(f"🧪 {test_name}\n")
+    buf.write("-" * 30 + "\n")
+
     try:
-        from sf_restcalls import SnowflakeClient
-        
-        print("🔍 Checking for stored procedures...")
-        
-        client = SnowflakeClient(
-            account=config['account'],
-            username=config['username'],
-            token=config['token'],
-            database=config.get('database'),
-            schema=config.get('schema'),
-            warehouse=config.get('warehouse'),
-            role=config.get('role')
-        )
-        
-        with client:
-            # Check for procedures
-            result = client.execute_query("SHOW PROCEDURES LIKE 'sp_%'")
-            
-            if result:
-                print("✅ Found stored procedures:")
-                for row in result:
-                    print(f"   - {row[1]}")  # Procedure name is typically in second column
-                return True
-            else:
-                print("⚠️  No stored procedures found matching 'sp_%'")
-                print("💡 Run quick_user_setup.sql to create example procedures")
-                return False
-                
+        with contextlib.redirect_stdout(buf):
+            passed = bool(test_func())
+        buf.write("✅ PASSED\n\n" if passed else "❌ FAILED\n\n")
     except Exception as e:
-        print(f"❌ Failed to check procedures: {e}")
-        return False
+        buf.write(f"❌ ERROR: {e}\n\n")
+        passed = False
+
+    sys.stdout.write(buf.getvalue())
+    return passed
 
 def main():
     """Main test function."""
     print("🧪 Snowflake Setup Test")
     print("=" * 50)
-    
+
     # Load and validate configuration
     config = load_config()
     if not validate_config(config):
         sys.exit(1)
-    
-    print(f"🏗️  Testing setup for account: {config['account']}")
-    print(f"👤 User: {config['username']}")
+
+    print(f"🏗️  Testing setup for account: {config.account}")
+    print(f"👤 User: {config.username}")
     print()
-    
-    # Run tests
-    tests = [
-        ("Import Test", test_import),
-        ("Connection Test", lambda: test_connection(config)),
-        ("Procedures Check", lambda: test_procedures_exist(config)),
-        ("sp_example Test", lambda: test_sp_example(config))
-    ]
-    
-    passed = 0
-    total = len(tests)
-    
-    for test_name, test_func in tests:
-        print(f"🧪 {test_name}")
-        print("-" * 30)
-        
-        try:
-            if test_func():
+
+    passed = int(run_test("Import Test", test_import))
+    total = 4
+
+    # One connection, one multi-statement round-trip for all three probes
+    try:
+        probe_results = run_probes(config)
+    except Exception as e:
+        print(f"❌ Probe batch failed: {e}")
+        print("💡 Make sure credentials are valid and sp_example exists\n")
+        probe_results = None
+
+    if probe_results is not None:
+        probe_tests = [
+            ("Connection Test", test_connection, probe_results[0]),
+            ("Procedures Check", test_procedures_exist, probe_results[1]),
+            ("sp_example Test", test_sp_example, probe_results[2]),
+        ]
+        for name, func, result in probe_tests:
+            if run_test(name, lambda f=func, r=result: f(r)):
                 passed += 1
-                print("✅ PASSED\n")
-            else:
-                print("❌ FAILED\n")
-        except Exception as e:
-            print(f"❌ ERROR: {e}\n")
-    
+
     # Summary
     print("📊 Test Summary")
     print("=" * 50)
     print(f"Passed: {passed}/{total}")
-    
+
     if passed == total:
         print("🎉 All tests passed! Your setup is working correctly.")
         print("\n🚀 You can now use:")